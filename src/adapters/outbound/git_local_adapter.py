@@ -1,11 +1,26 @@
 import asyncio
 import logging
+import os
+import time
 from dataclasses import dataclass
 
 from src.application.ports.diff_collection_port import DiffResult
 
 logger = logging.getLogger(__name__)
 
+# git 자식 프로세스에 넘길 최소 환경변수 (전체 환경 복사 대신 필요한 것만)
+# LC_ALL=C: git 내부 로케일 처리 생략 (커밋 메시지 인코딩에는 영향 없음)
+_GIT_ENV_KEYS = (
+    "PATH", "HOME", "XDG_CONFIG_HOME", "TMPDIR",
+    # Windows에서 git 실행/설정 탐색에 필요
+    "SYSTEMROOT", "USERPROFILE", "HOMEDRIVE", "HOMEPATH", "TEMP", "TMP",
+)
+_GIT_ENV = {
+    **{key: os.environ[key] for key in _GIT_ENV_KEYS if key in os.environ},
+    **{key: value for key, value in os.environ.items() if key.startswith("GIT_")},
+    "LC_ALL": "C",
+}
+
 
 @dataclass(frozen=True)
 class _GitResult:
@@ -22,6 +37,76 @@ class _MergeExtraction:
     diff_stat: str
 
 
+class _GitWorker:
+    """`git cat-file --batch-check` 상주 프로세스로 ref 존재 여부를 조회합니다.
+
+    ref 확인마다 git을 새로 띄우지 않고 stdin/stdout 한 줄 왕복으로 처리합니다.
+    요청은 lock으로 직렬화하며, 프로세스가 죽거나 응답이 없으면 다음 요청에서 다시 띄웁니다.
+    """
+
+    def __init__(self, working_dir: str, timeout: float):
+        self._working_dir = working_dir
+        self._timeout = timeout
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._proc is None or self._proc.returncode is not None:
+            self._proc = await asyncio.create_subprocess_exec(
+                "git", "cat-file", "--batch-check",
+                cwd=self._working_dir,
+                env=_GIT_ENV,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._proc
+
+    async def ref_exists(self, name: str) -> bool:
+        """ref(브랜치명, SHA 등)가 객체로 해석되면 True를 반환합니다.
+
+        Raises:
+            RuntimeError: 워커 프로세스 실행/응답 실패 시
+        """
+        # 요청은 줄 단위로 구분되므로 줄바꿈이 포함된 이름은 ref가 될 수 없음
+        if not name or "\n" in name:
+            return False
+        async with self._lock:
+            try:
+                proc = await self._ensure_started()
+                proc.stdin.write(name.encode("utf-8") + b"\n")
+                await proc.stdin.drain()
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout=self._timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                await self._discard()
+                raise RuntimeError(f"git cat-file 워커 실패: {e!r}") from e
+            except asyncio.CancelledError:
+                # 응답을 읽지 못한 채 취소되면 요청/응답 짝이 어긋나므로 워커를 버림
+                await self._discard()
+                raise
+            if not line:
+                await self._discard()
+                raise RuntimeError("git cat-file 워커가 종료되었습니다")
+        # 존재: "<sha> <type> <size>", 미존재: "<name> missing" / "<name> ambiguous"
+        return line.rstrip().rsplit(b" ", 1)[-1] not in (b"missing", b"ambiguous")
+
+    async def _discard(self) -> None:
+        """워커 프로세스를 종료하고 회수합니다. (lock 보유 상태에서 호출)"""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            proc.stdin.close()
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+
+    async def aclose(self) -> None:
+        """진행 중인 요청이 끝난 뒤 워커 프로세스를 종료합니다."""
+        async with self._lock:
+            await self._discard()
+
+
 class GitLocalAdapter:
     """로컬 git 명령을 사용하여 커밋/diff를 수집하는 Adapter"""
 
@@ -35,12 +120,28 @@ class GitLocalAdapter:
     # git 명령 실행 timeout (초)
     _GIT_TIMEOUT_SECONDS = 60
 
-    def __init__(self, working_dir: str = "."):
+    # collect_by_branch 결과 캐시 (ref가 하나라도 움직이면 무효)
+    _RESULT_CACHE_TTL_SECONDS = 60.0
+    _RESULT_CACHE_MAX_SIZE = 8
+
+    # 저장소별 동시 git 프로세스 수 기본값 (packfile 경합 방지)
+    _DEFAULT_MAX_CONCURRENT_GIT = min(4, os.cpu_count() or 1)
+
+    def __init__(self, working_dir: str = ".", max_concurrent_git: int = _DEFAULT_MAX_CONCURRENT_GIT):
         """
         Args:
             working_dir: git 명령을 실행할 작업 디렉토리 (기본값: 현재 디렉토리)
+            max_concurrent_git: 이 저장소에서 동시에 실행할 git 프로세스 최대 수
         """
         self.working_dir = working_dir
+        self._git_sem = asyncio.Semaphore(max_concurrent_git)
+        self._worker = _GitWorker(working_dir, self._GIT_TIMEOUT_SECONDS)
+        # (branch_name, include_diff) → (만료 시각, ref 목록 스냅샷, 결과)
+        self._result_cache: dict[tuple[str, bool], tuple[float, str, DiffResult]] = {}
+
+    async def aclose(self) -> None:
+        """상주 git cat-file 워커를 종료합니다 (서버 종료 또는 어댑터 폐기 시 호출)."""
+        await self._worker.aclose()
 
     async def _run_git(self, *args: str) -> _GitResult:
         """git 명령을 실행하고 결과를 반환합니다.
@@ -54,28 +155,72 @@ class GitLocalAdapter:
         Raises:
             RuntimeError: timeout 초과 시
         """
-        proc = await asyncio.create_subprocess_exec(
-            "git", *args,
-            cwd=self.working_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        try:
-            stdout, _ = await asyncio.wait_for(
-                proc.communicate(), timeout=self._GIT_TIMEOUT_SECONDS,
-            )
-        except asyncio.TimeoutError:
-            proc.kill()
-            raise RuntimeError(
-                f"git 명령 timeout ({self._GIT_TIMEOUT_SECONDS}초 초과): git {' '.join(args)}"
+        async with self._git_sem:
+            proc = await asyncio.create_subprocess_exec(
+                "git", *args,
+                cwd=self.working_dir,
+                env=_GIT_ENV,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    proc.communicate(), timeout=self._GIT_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                raise RuntimeError(
+                    f"git 명령 timeout ({self._GIT_TIMEOUT_SECONDS}초 초과): git {' '.join(args)}"
+                )
         return _GitResult(
-            stdout=stdout.decode("utf-8").strip(),
+            stdout=stdout.strip().decode("utf-8"),
             returncode=proc.returncode,
         )
 
+    async def _run_git_diff(self, *args: str, include_diff: bool = True) -> str:
+        """`git diff`를 실행해 출력을 반환합니다.
+
+        include_diff=False이면 git을 실행하지 않고 빈 문자열을 반환합니다.
+        """
+        if not include_diff:
+            return ""
+        return (await self._run_git("diff", *args)).stdout
+
+    async def _ref_exists(self, name: str) -> bool:
+        """ref가 존재하는지 확인합니다 (`git rev-parse --verify` 대체).
+
+        상주 cat-file 워커를 사용하고, 워커를 쓸 수 없으면 rev-parse로 폴백합니다.
+        """
+        try:
+            return await self._worker.ref_exists(name)
+        except RuntimeError as e:
+            logger.warning("cat-file 워커 사용 불가, rev-parse로 폴백: %s", e)
+        result = await self._run_git("rev-parse", "--verify", "--quiet", name)
+        return result.returncode == 0
+
+    async def _list_refs(self) -> str:
+        """로컬/원격 브랜치 ref 목록을 "<ref> <SHA>" 줄 단위로 한 번의 git 호출로 조회합니다.
+
+        후보 브랜치마다 `rev-parse --verify`를 실행하던 것을 대체하며,
+        결과 전체는 ref 이동 여부를 판단하는 캐시 키로도 사용합니다. 실패 시 빈 문자열.
+        """
+        result = await self._run_git(
+            "for-each-ref", "--format=%(refname:short) %(objectname)", "refs/heads", "refs/remotes",
+        )
+        return result.stdout if result.returncode == 0 else ""
+
+    @staticmethod
+    def _ref_names(ref_listing: str) -> frozenset[str]:
+        """_list_refs 결과에서 ref 이름만 추출합니다."""
+        return frozenset(line.partition(" ")[0] for line in ref_listing.splitlines())
+
+    async def _existing_refs(self) -> frozenset[str]:
+        """로컬/원격 브랜치 ref 이름 목록을 조회합니다."""
+        return self._ref_names(await self._list_refs())
+
     async def _extract_from_merge_commit(
         self, branch_name: str, *, raise_on_failure: bool = False,
+        refs: frozenset[str] | None = None, include_diff: bool = True,
     ) -> _MergeExtraction | None:
         """대상 브랜치(dev, master 등)에서 머지 커밋을 찾아 커밋/diff를 추출합니다.
 
@@ -85,6 +230,8 @@ class GitLocalAdapter:
         Args:
             branch_name: 머지 커밋을 검색할 브랜치명
             raise_on_failure: True이면 실패 시 RuntimeError를 발생시킵니다
+            refs: 미리 조회한 브랜치 ref 목록 (None이면 직접 조회)
+            include_diff: False이면 diff 본문을 생략합니다 (커밋 목록과 --stat만 수집)
 
         Returns:
             추출 성공 시 _MergeExtraction, 실패 시 None (raise_on_failure=False일 때)
@@ -92,35 +239,31 @@ class GitLocalAdapter:
         Raises:
             RuntimeError: raise_on_failure=True이고 머지 커밋/부모 SHA를 찾을 수 없을 때
         """
-        merge_lines: list[str] = []
+        # 가장 최근 머지 커밋 하나만 "<SHA> <부모 SHA들>" 형식으로 조회 (%P = space-separated parent SHAs)
+        merge_record = ""
+        if refs is None:
+            refs = await self._existing_refs()
 
         for target in self._BASE_BRANCH_CANDIDATES:
-            check = await self._run_git("rev-parse", "--verify", target)
-            if check.returncode != 0:
+            if target not in refs:
                 continue
 
             merge_result = await self._run_git(
-                "log", target, "--merges", "--oneline", f"--grep={branch_name}",
+                "log", target, "--merges", "--max-count=1", "--format=%H %P", f"--grep={branch_name}",
             )
-            merge_lines = merge_result.stdout.splitlines()
-            if merge_lines:
+            merge_record = merge_result.stdout
+            if merge_record:
                 logger.info("머지 커밋 발견: target=%s, branch=%s", target, branch_name)
                 break
 
-        if not merge_lines:
+        if not merge_record:
             if raise_on_failure:
                 raise RuntimeError(f"브랜치를 찾을 수 없습니다: {branch_name}")
             return None
 
-        # 첫 번째 머지 커밋 SHA
-        merge_sha = merge_lines[0].split(" ", 1)[0]
+        merge_sha, *parents = merge_record.split()
         logger.info("머지 커밋 SHA: %s", merge_sha)
 
-        # 머지 커밋 부모 SHA 추출 (%P = space-separated parent SHAs)
-        parents_result = await self._run_git(
-            "show", merge_sha, "--no-patch", "--format=%P",
-        )
-        parents = parents_result.stdout.split()
         if len(parents) < 2:
             if raise_on_failure:
                 raise RuntimeError(f"머지 커밋 부모 SHA를 파싱할 수 없습니다: {merge_sha}")
@@ -128,47 +271,56 @@ class GitLocalAdapter:
 
         parent1, parent2 = parents[0], parents[1]
 
-        # 브랜치 전용 커밋 목록 (parent1..parent2)
-        log_result = await self._run_git(
-            "log", f"{parent1}..{parent2}", "--oneline", "--no-merges",
-        )
-
-        # 머지 diff (머지가 dev에 추가한 변경사항만)
-        diff_result = await self._run_git(
-            "diff", f"{merge_sha}^1", merge_sha,
-        )
-
-        # 파일별 변경 통계
-        stat_result = await self._run_git(
-            "diff", "--stat", f"{merge_sha}^1", merge_sha,
+        # 브랜치 전용 커밋 목록 (parent1..parent2), 머지 diff (머지가 dev에 추가한 변경사항만),
+        # 파일별 변경 통계는 서로 독립적이므로 동시에 실행합니다.
+        log_result, diff_raw, stat_result = await asyncio.gather(
+            self._run_git("log", f"{parent1}..{parent2}", "--oneline", "--no-merges"),
+            self._run_git_diff(f"{merge_sha}^1", merge_sha, include_diff=include_diff),
+            self._run_git("diff", "--stat", f"{merge_sha}^1", merge_sha),
         )
 
         return _MergeExtraction(
             commits_raw=log_result.stdout,
-            diff_raw=diff_result.stdout,
+            diff_raw=diff_raw,
             diff_stat=stat_result.stdout,
         )
 
-    async def _find_base_branch(self) -> str:
+    async def _find_base_branch(self, refs: frozenset[str] | None = None) -> str:
         """베이스 브랜치를 찾습니다. dev → origin/dev → develop → origin/develop → main → master 순서로 폴백"""
-        for candidate in self._BASE_BRANCH_CANDIDATES:
-            result = await self._run_git("rev-parse", "--verify", candidate)
-            if result.returncode == 0:
-                logger.info("베이스 브랜치 발견: %s", candidate)
-                return candidate
+        if refs is None:
+            refs = await self._existing_refs()
+        candidate = next((c for c in self._BASE_BRANCH_CANDIDATES if c in refs), None)
+        if candidate is not None:
+            logger.info("베이스 브랜치 발견: %s", candidate)
+            return candidate
 
         logger.warning("베이스 브랜치를 찾을 수 없습니다. HEAD 사용")
         return "HEAD"
 
-    async def collect_by_branch(self, branch_name: str) -> DiffResult:
+    async def collect_by_branch(self, branch_name: str, *, include_diff: bool = True) -> DiffResult:
         """브랜치명 기반 커밋 목록 + diff 수집.
 
         우선순위:
         1. 머지 커밋 기반 수집 (dev/master에서 검색, 오염 없음)
         2. 활성 브랜치에서 직접 수집 (아직 머지 안 된 경우)
+
+        include_diff=False이면 diff 본문은 생략하고 diff_raw는 빈 문자열입니다.
+
+        같은 인자의 결과는 TTL 동안 캐시하며, 브랜치 ref가 하나라도 바뀌면 다시 수집합니다.
         """
+        ref_listing = await self._list_refs()
+        cache_key = (branch_name, include_diff)
+        now = time.monotonic()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None and cached[0] > now and cached[1] == ref_listing:
+            logger.info("로컬 git 수집 캐시 사용: branch=%s", branch_name)
+            return cached[2]
+        refs = self._ref_names(ref_listing)
+
         # 1순위: 머지 커밋에서 추출 (깨끗한 커밋/diff)
-        extraction = await self._extract_from_merge_commit(branch_name)
+        extraction = await self._extract_from_merge_commit(
+            branch_name, refs=refs, include_diff=include_diff,
+        )
         if extraction is not None:
             logger.info("머지 커밋 기반 수집 성공: %s", branch_name)
             commits_raw = extraction.commits_raw
@@ -176,60 +328,58 @@ class GitLocalAdapter:
             diff_stat = extraction.diff_stat
         else:
             # 2순위: 브랜치가 존재하면 직접 수집 (아직 머지 전)
-            check = await self._run_git("rev-parse", "--verify", branch_name)
-            if check.returncode == 0:
-                commits_raw, diff_raw, diff_stat = await self._collect_from_existing_branch(branch_name)
+            if await self._ref_exists(branch_name):
+                commits_raw, diff_raw, diff_stat = await self._collect_from_existing_branch(
+                    branch_name, refs=refs, include_diff=include_diff,
+                )
             else:
                 raise RuntimeError(f"브랜치를 찾을 수 없습니다: {branch_name}")
 
         logger.info(
             "로컬 git 수집 완료: branch=%s, commits=%d lines, diff=%d chars",
-            branch_name, len(commits_raw.splitlines()), len(diff_raw),
+            branch_name, commits_raw.count("\n") + 1 if commits_raw else 0, len(diff_raw),
         )
 
-        return DiffResult(
+        result = DiffResult(
             commits_raw=commits_raw,
             diff_raw=diff_raw,
             diff_stat=diff_stat,
             branch_name=branch_name,
             source="local_git",
         )
-
-    async def _collect_from_existing_branch(self, branch_name: str) -> tuple[str, str, str]:
+        self._result_cache.pop(cache_key, None)
+        if len(self._result_cache) >= self._RESULT_CACHE_MAX_SIZE:
+            # 가장 오래 전에 저장된 항목부터 제거 (dict 삽입 순서)
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[cache_key] = (now + self._RESULT_CACHE_TTL_SECONDS, ref_listing, result)
+        return result
+
+    async def _collect_from_existing_branch(
+        self, branch_name: str, *,
+        refs: frozenset[str] | None = None, include_diff: bool = True,
+    ) -> tuple[str, str, str]:
         """활성 브랜치에서 커밋/diff를 직접 수집합니다 (아직 머지 전).
 
         Returns:
             (commits_raw, diff_raw, diff_stat) 튜플
         """
-        base_branch = await self._find_base_branch()
+        base_branch = await self._find_base_branch(refs)
         logger.info("활성 브랜치 커밋 범위: %s..%s", base_branch, branch_name)
 
-        log_result = await self._run_git(
-            "log", f"{base_branch}..{branch_name}", "--oneline", "--no-merges",
-        )
-
-        diff_result = await self._run_git(
-            "diff", f"{base_branch}...{branch_name}",
+        log_result, diff_raw, stat_result = await asyncio.gather(
+            self._run_git("log", f"{base_branch}..{branch_name}", "--oneline", "--no-merges"),
+            self._run_git_diff(f"{base_branch}...{branch_name}", include_diff=include_diff),
+            self._run_git("diff", "--stat", f"{base_branch}...{branch_name}"),
         )
 
-        stat_result = await self._run_git(
-            "diff", "--stat", f"{base_branch}...{branch_name}",
-        )
-
-        return log_result.stdout, diff_result.stdout, stat_result.stdout
+        return log_result.stdout, diff_raw, stat_result.stdout
 
     async def collect_by_commit_range(self, from_ref: str, to_ref: str) -> DiffResult:
         """커밋 범위 기반 diff 수집"""
-        log_result = await self._run_git(
-            "log", f"{from_ref}..{to_ref}", "--oneline", "--no-merges",
-        )
-
-        diff_result = await self._run_git(
-            "diff", f"{from_ref}..{to_ref}",
-        )
-
-        stat_result = await self._run_git(
-            "diff", "--stat", f"{from_ref}..{to_ref}",
+        log_result, diff_result, stat_result = await asyncio.gather(
+            self._run_git("log", f"{from_ref}..{to_ref}", "--oneline", "--no-merges"),
+            self._run_git("diff", f"{from_ref}..{to_ref}"),
+            self._run_git("diff", "--stat", f"{from_ref}..{to_ref}"),
         )
 
         return DiffResult(
@@ -1,55 +1,74 @@
+import heapq
 import logging
-import threading
-from datetime import datetime, timedelta
+import time
 
 from src.domain.wiki_workflow import WikiSession
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TTL_MINUTES = 30
+# save() 시 만료 세션 정리(cleanup_expired)를 실행하는 최소 간격 (초)
+_CLEANUP_INTERVAL_SECONDS = 60.0
 
 
 class InMemorySessionStore:
-    """In-memory Wiki 세션 저장소 (TTL 기반 자동 만료)"""
+    """In-memory Wiki 세션 저장소 (TTL 기반 자동 만료)
+
+    단일 키 dict 조회/대입/pop은 GIL 하에서 원자적이므로 별도 lock을 두지 않습니다.
+    만료 세션 삭제가 경합하더라도 pop(..., None)이라 결과는 같습니다.
+    """
 
     def __init__(self, ttl_minutes: int = _DEFAULT_TTL_MINUTES):
         self._sessions: dict[str, WikiSession] = {}
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._lock = threading.Lock()
+        self._ttl_seconds = ttl_minutes * 60
+        # (저장 시점 updated_at_monotonic, session_id) 최소 힙 — 오래된 세션부터 꺼내 확인
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._next_cleanup = time.monotonic() + _CLEANUP_INTERVAL_SECONDS
 
     def save(self, session: WikiSession) -> None:
         session.touch()
-        with self._lock:
-            self._sessions[session.session_id] = session
+        self._sessions[session.session_id] = session
+        heapq.heappush(self._expiry_heap, (session.updated_at_monotonic, session.session_id))
         logger.info("세션 저장: id=%s, state=%s", session.session_id, session.state.value)
+        # 힙이 저장 횟수만큼 계속 쌓이지 않도록 주기적으로 오래된 항목을 정리
+        if session.updated_at_monotonic >= self._next_cleanup:
+            self._next_cleanup = session.updated_at_monotonic + _CLEANUP_INTERVAL_SECONDS
+            self.cleanup_expired()
 
     def get(self, session_id: str) -> WikiSession | None:
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            if self._is_expired(session):
-                del self._sessions[session_id]
-                logger.info("만료된 세션 삭제: id=%s", session_id)
-                return None
-            return session
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if self._is_expired(session):
+            self._sessions.pop(session_id, None)
+            logger.info("만료된 세션 삭제: id=%s", session_id)
+            return None
+        return session
 
     def delete(self, session_id: str) -> None:
-        with self._lock:
-            self._sessions.pop(session_id, None)
+        self._sessions.pop(session_id, None)
 
     def cleanup_expired(self) -> int:
-        now = datetime.now()
-        with self._lock:
-            expired = [
-                sid for sid, s in self._sessions.items()
-                if now - s.updated_at > self._ttl
-            ]
-            for sid in expired:
-                del self._sessions[sid]
+        """만료 세션을 정리합니다.
+
+        힙에서 기준 시각보다 오래된 항목만 꺼내 확인하므로, 실제 만료 건수에 비례해 동작합니다.
+        이후 다시 저장된 세션(save가 최신 시각으로 이미 등록)과 삭제된 세션의 항목은 버립니다.
+        save()가 _CLEANUP_INTERVAL_SECONDS마다 호출합니다.
+        """
+        # 스윕당 한 번만 기준 시각을 계산 (이보다 오래 갱신되지 않은 세션이 만료 대상)
+        cutoff = time.monotonic() - self._ttl_seconds
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] < cutoff:
+            stamp, sid = heapq.heappop(heap)
+            session = self._sessions.get(sid)
+            if session is None or session.updated_at_monotonic != stamp:
+                continue
+            self._sessions.pop(sid, None)
+            expired += 1
         if expired:
-            logger.info("만료 세션 정리: %d건 삭제", len(expired))
-        return len(expired)
+            logger.info("만료 세션 정리: %d건 삭제", expired)
+        return expired
 
     def _is_expired(self, session: WikiSession) -> bool:
-        return datetime.now() - session.updated_at > self._ttl
+        return time.monotonic() - session.updated_at_monotonic > self._ttl_seconds
@@ -1,11 +1,18 @@
+import asyncio
 import logging
+from typing import Iterable
 
 import httpx
 
+from src.common import json_codec
+from src.common.singleflight import SingleFlight
 from src.domain.jira import JiraIssue, JiraFilter, JiraProjectConfig, JiraProjectMeta
 
 logger = logging.getLogger(__name__)
 
+# 응답에 없는 중첩 객체 대신 쓰는 공용 빈 dict (읽기 전용으로만 사용)
+_EMPTY: dict = {}
+
 
 def _collect_custom_field_ids(configs: list[JiraProjectConfig]) -> set[str]:
     """설정에서 참조하는 모든 customfield_* 필드 ID를 수집"""
@@ -29,84 +36,163 @@ def _build_field_display_names(configs: list[JiraProjectConfig]) -> dict[str, st
             display_names[field_id] = display_name
     return display_names
 
+
+def _rank(statuses: Iterable[str]) -> dict[str, int]:
+    """상태명 나열을 {상태명: 처음 등장한 순위} 매핑으로 변환합니다 (중복은 앞선 순위 유지)."""
+    rank: dict[str, int] = {}
+    for status in statuses:
+        rank.setdefault(status, len(rank))
+    return rank
+
+
+def _transition_target(transition: dict) -> str:
+    """트랜지션의 목표 상태명을 반환합니다."""
+    return transition.get("to", {}).get("name", "")
+
+
+def _project_prefix(issue_key: str) -> str:
+    """이슈 키의 프로젝트 프리픽스를 반환합니다 (예: PROJ-123 → PROJ, '-' 없으면 빈 문자열)."""
+    prefix, sep, _ = issue_key.partition("-")
+    return prefix if sep else ""
+
+
 class JiraAdapter:
     """Jira REST API와 통신하는 Outbound Adapter"""
 
+    # search_issues 페이지 크기 (Jira 서버 설정에 따라 더 작게 잘릴 수 있음)
+    _SEARCH_BATCH_SIZE = 500
+    # search_issues 후속 페이지 동시 요청 상한 (Jira rate limit 회피)
+    _SEARCH_CONCURRENCY = 8
+
     def __init__(self, base_url: str, user: str, password: str, project_configs: list[JiraProjectConfig] | None = None):
         self.base_url = base_url.rstrip("/")
+        # 이슈별 URL의 고정 접두부 (이슈 키만 이어 붙여 사용)
+        self._issue_url_base = f"{self.base_url}/rest/api/2/issue/"
+        self._browse_base = f"{self.base_url}/browse/"
         self.user = user
         self.password = password
         self._project_configs = project_configs or []
         self._configs_by_key: dict[str, JiraProjectConfig] = {c.key: c for c in self._project_configs}
-        self._custom_field_ids: set[str] = _collect_custom_field_ids(self._project_configs)
+        # 정렬된 튜플로 고정해 _parse_issue 순회 순서와 search fields 파라미터를 한 번만 계산
+        self._custom_field_ids: tuple[str, ...] = tuple(sorted(_collect_custom_field_ids(self._project_configs)))
+        self._search_fields = ",".join(
+            ("key", "summary", "status", "assignee", "description", "issuetype", "created")
+            + self._custom_field_ids
+        )
         self._field_display_names: dict[str, str] = _build_field_display_names(self._project_configs)
+        # 완료 상태 우선순위 {상태명: 순위} (설정은 고정이므로 생성 시 한 번만 계산)
+        self._done_rank_by_key: dict[str, dict[str, int]] = {
+            c.key: _rank(done_list)
+            for c in self._project_configs
+            if (done_list := c.status_mapping.get("done", []))
+        }
+        # 종료일 필드 {프로젝트 키: 필드 ID} (종료일을 설정하지 않는 프로젝트는 제외)
+        self._due_date_field_by_key: dict[str, str] = {
+            c.key: c.due_date_field for c in self._project_configs if c.due_date_field
+        }
+        # 특정 프로젝트 매칭 실패 시 사용할 전체 configs의 done 매핑 합집합
+        self._done_rank_fallback: dict[str, int] = _rank(
+            s for c in self._project_configs for s in c.status_mapping.get("done", [])
+        )
+        self._search_sem = asyncio.Semaphore(self._SEARCH_CONCURRENCY)
+        # 동일 인자로 동시에 들어온 조회를 하나의 API 호출로 합침
+        self._search_flights: SingleFlight[list[JiraIssue]] = SingleFlight()
+        self._meta_flights: SingleFlight[JiraProjectMeta] = SingleFlight()
+        # 요청 간 연결(keep-alive)을 재사용하는 공유 클라이언트 (첫 요청 시 생성)
+        self._http: httpx.AsyncClient | None = None
 
-    def _get_done_status_priority(self, issue_key: str) -> list[str]:
-        """이슈 키에서 프로젝트별 완료 상태 우선순위를 결정합니다.
+    def _get_done_status_rank(self, issue_key: str) -> dict[str, int]:
+        """이슈 키에서 프로젝트별 완료 상태 우선순위를 {상태명: 순위}로 반환합니다.
 
         전략:
         1. 이슈 키의 프로젝트 프리픽스와 매칭되는 config의 status_mapping["done"] 사용
         2. 매칭 실패 시 모든 프로젝트의 "done" 매핑 합집합
         """
-        project_prefix = issue_key.split("-")[0] if "-" in issue_key else ""
-        config = self._configs_by_key.get(project_prefix)
-
-        if config:
-            done_list = config.status_mapping.get("done", [])
-            if done_list:
-                return done_list
-
-        # 특정 프로젝트 매칭 실패 시, 전체 configs의 done 매핑 합집합
-        all_done: list[str] = []
-        seen: set[str] = set()
-        for c in self._project_configs:
-            for s in c.status_mapping.get("done", []):
-                if s not in seen:
-                    all_done.append(s)
-                    seen.add(s)
-        return all_done
+        return self._done_rank_by_key.get(_project_prefix(issue_key), self._done_rank_fallback)
 
     # ------------------------------------------------------------------
     # Public methods
     # ------------------------------------------------------------------
 
-    async def search_issues(self, jql: str) -> list[JiraIssue]:
-        """JQL 쿼리를 사용하여 Jira 이슈를 조회합니다."""
+    async def search_issues(
+        self,
+        jql: str,
+        *,
+        batch_size: int = _SEARCH_BATCH_SIZE,
+        max_total: int | None = None,
+    ) -> list[JiraIssue]:
+        """JQL 쿼리를 사용하여 Jira 이슈를 조회합니다.
+
+        startAt/maxResults로 batch_size건씩 페이지를 나눠 전체(또는 max_total건까지)를 조회합니다.
+        첫 페이지에서 total을 확인한 뒤 나머지 페이지는 병렬로 요청합니다.
+        서버가 maxResults를 더 작게 제한하면 실제 받은 건수를 페이지 크기로 사용합니다.
+        """
+        issues = await self._search_flights.do(
+            (jql, batch_size, max_total),
+            lambda: self._search_issues(jql, batch_size, max_total),
+        )
+        # 같은 결과를 공유하는 호출자끼리 리스트 변경이 섞이지 않도록 복사본 반환
+        return list(issues)
+
+    async def _search_issues(
+        self, jql: str, batch_size: int, max_total: int | None,
+    ) -> list[JiraIssue]:
         url = f"{self.base_url}/rest/api/2/search"
-        base_fields = "key,summary,status,assignee,description,issuetype,created"
-        if self._custom_field_ids:
-            fields_str = f"{base_fields},{','.join(sorted(self._custom_field_ids))}"
-        else:
-            fields_str = base_fields
-        params = {
-            "jql": jql,
-            "fields": fields_str,
-        }
+        fields_str = self._search_fields
 
         logger.info("🌐 Jira API 호출 시작")
         logger.info("URL: %s", url)
         logger.info("JQL: %s", jql)
         logger.info("User: %s", self.user)
 
-        data = await self._request(
-            "GET",
-            url,
-            params=params,
-            context_msg="Jira 이슈 조회",
-        )
-
-        total = data.get("total", 0)
+        first_limit = batch_size if max_total is None else min(batch_size, max_total)
+        total, issues = await self._search_page(url, jql, fields_str, 0, first_limit)
         logger.info("총 이슈 수: %d", total)
 
-        issues = []
-        for issue_data in data.get("issues", []):
-            issue = self._parse_issue(issue_data)
-            issues.append(issue)
-            logger.info("  - %s: %s [%s]", issue.key, issue.summary, issue.status)
+        # 첫 응답으로 total과 실제 페이지 크기(서버가 maxResults를 줄였을 수 있음)를 알면
+        # 나머지 페이지는 서로 독립이므로 동시에 요청
+        page_size = len(issues)
+        end = total if max_total is None else min(total, max_total)
+        if page_size and page_size < end:
+            rest = await asyncio.gather(*(
+                self._search_page(url, jql, fields_str, start, min(page_size, end - start))
+                for start in range(page_size, end, page_size)
+            ))
+            for _, page in rest:
+                issues.extend(page)
+        if max_total is not None:
+            del issues[max_total:]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for issue in issues:
+                logger.debug("  - %s: %s [%s]", issue.key, issue.summary, issue.status)
 
         logger.info("✅ Jira 이슈 조회 성공: %d건", len(issues))
         return issues
 
+    async def _search_page(
+        self, url: str, jql: str, fields_str: str, start_at: int, max_results: int,
+    ) -> tuple[int, list[JiraIssue]]:
+        """search API 한 페이지를 조회해 (total, 파싱된 이슈 목록)을 반환합니다.
+
+        응답 JSON은 페이지 단위로 바로 JiraIssue로 변환하고 버려, 여러 페이지의 원본 dict가
+        동시에 메모리에 쌓이지 않도록 합니다. (동시 요청 수는 _search_sem으로 제한)
+        """
+        async with self._search_sem:
+            data = await self._request(
+                "GET",
+                url,
+                params={
+                    "jql": jql,
+                    "fields": fields_str,
+                    "startAt": start_at,
+                    "maxResults": max_results,
+                },
+                context_msg="Jira 이슈 조회",
+            )
+        parse = self._parse_issue
+        return data.get("total", 0), [parse(issue_data) for issue_data in data.get("issues", [])]
+
     async def create_filter(self, name: str, jql: str) -> JiraFilter:
         """Jira 필터를 생성합니다."""
         url = f"{self.base_url}/rest/api/2/filter"
@@ -147,6 +233,11 @@ class JiraAdapter:
 
     async def get_project_meta(self, project_key: str) -> JiraProjectMeta:
         """프로젝트의 이슈 유형과 각 유형별 상태값을 조회합니다."""
+        return await self._meta_flights.do(
+            project_key, lambda: self._get_project_meta(project_key),
+        )
+
+    async def _get_project_meta(self, project_key: str) -> JiraProjectMeta:
         logger.info("🌐 Jira 프로젝트 메타 조회 시작: %s", project_key)
 
         issuetypes_url = f"{self.base_url}/rest/api/2/project/{project_key}/statuses"
@@ -162,11 +253,13 @@ class JiraAdapter:
 
         # issuetype별 상태값 파싱
         issuetype_statuses: dict[str, list[str]] = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
         for item in statuses_data:
             issuetype_name = item.get("name", "Unknown")
             statuses = [s.get("name", "") for s in item.get("statuses", [])]
             issuetype_statuses[issuetype_name] = statuses
-            logger.info("  이슈 유형: %s → 상태: %s", issuetype_name, statuses)
+            if debug:
+                logger.debug("  이슈 유형: %s → 상태: %s", issuetype_name, statuses)
 
         logger.info("✅ 프로젝트 메타 조회 성공: %d개 이슈 유형", len(issuetype_statuses))
 
@@ -177,7 +270,7 @@ class JiraAdapter:
 
     async def get_issue_attachments(self, issue_key: str) -> list[dict]:
         """이슈의 첨부파일 메타정보를 조회합니다."""
-        url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
+        url = self._issue_url_base + issue_key
         params = {"fields": "attachment"}
 
         logger.info("🌐 Jira 첨부파일 조회: %s", issue_key)
@@ -207,12 +300,11 @@ class JiraAdapter:
         """첨부파일 바이너리 데이터를 다운로드합니다."""
         logger.info("🌐 첨부파일 다운로드: %s", content_url[:80])
         try:
-            async with self._client() as client:
-                response = await client.get(content_url)
-                response.raise_for_status()
-                return response.content
+            response = await self._client().get(content_url)
+            response.raise_for_status()
+            return response.content
         except Exception as e:
-            logger.error("❌ 첨부파일 다운로드 실패: %s", str(e))
+            logger.error("❌ 첨부파일 다운로드 실패: %s", e)
             raise RuntimeError(f"첨부파일 다운로드 실패: {str(e)}") from e
 
     async def complete_issue(self, key: str, due_date: str) -> dict[str, str]:
@@ -224,59 +316,56 @@ class JiraAdapter:
         """
         logger.info("🔄 이슈 완료 처리 시작: key=%s, due_date=%s", key, due_date)
 
-        async with self._client() as client:
-            # 트랜지션 목록을 미리 조회해 완료 상태 후보 결정
-            transitions_url = f"{self.base_url}/rest/api/2/issue/{key}/transitions"
-            resp = await client.get(transitions_url)
-            resp.raise_for_status()
-            transitions_map: dict[str, str] = {
-                t.get("to", {}).get("name", ""): t.get("id", "")
-                for t in resp.json().get("transitions", [])
-            }
-
-            done_priority = self._get_done_status_priority(key)
-            target_status = next(
-                (s for s in done_priority if s in transitions_map),
-                None,
-            )
+        client = self._client()
+        # 트랜지션 목록을 미리 조회해 완료 상태 후보 결정 (이슈 정보도 함께 조회해 _do_transition에 전달)
+        issue_data, transitions = await self._fetch_transition_context(client, key)
+        target_names = [_transition_target(t) for t in transitions]
+
+        # 전환 가능한 상태 중 완료 우선순위가 가장 높은 것 선택
+        done_rank = self._get_done_status_rank(key)
+        target_status = min(
+            (s for s in target_names if s in done_rank),
+            key=done_rank.__getitem__,
+            default=None,
+        )
 
-            # 휴리스틱 폴백: done_priority가 비어있거나 매칭 실패 시
-            # 트랜지션에서 "완료" 또는 "done" 포함하는 상태를 자동 탐색
-            if not target_status:
-                for name in transitions_map:
-                    if "완료" in name or "done" in name.lower():
-                        target_status = name
-                        logger.info("🔍 휴리스틱 폴백으로 완료 상태 탐색: '%s'", target_status)
-                        break
-
-            if not target_status:
-                available = list(transitions_map.keys())
-                raise RuntimeError(
-                    f"이슈 '{key}'에서 완료 상태로 전환할 수 있는 트랜지션이 없습니다. "
-                    f"사용 가능한 트랜지션: {available}"
-                )
-
-            summary, current_status, resolved_status, _ = await self._do_transition(
-                client=client,
-                key=key,
-                target_status=target_status,
+        # 휴리스틱 폴백: 완료 우선순위가 비어있거나 매칭 실패 시
+        # 트랜지션에서 "완료" 또는 "done" 포함하는 상태를 자동 탐색
+        if not target_status:
+            for name in target_names:
+                if "완료" in name or "done" in name.lower():
+                    target_status = name
+                    logger.info("🔍 휴리스틱 폴백으로 완료 상태 탐색: '%s'", target_status)
+                    break
+
+        if not target_status:
+            raise RuntimeError(
+                f"이슈 '{key}'에서 완료 상태로 전환할 수 있는 트랜지션이 없습니다. "
+                f"사용 가능한 트랜지션: {target_names}"
             )
 
-            # 프로젝트 설정에 따라 종료일 처리
-            project_prefix = key.split("-")[0] if "-" in key else ""
-            config = self._configs_by_key.get(project_prefix)
-            due_date_field = config.due_date_field if config else None
-
-            if due_date_field:
-                resp = await client.put(
-                    f"{self.base_url}/rest/api/2/issue/{key}",
-                    json={"fields": {due_date_field: due_date}},
-                )
-                resp.raise_for_status()
-                display_name = self._field_display_names.get(due_date_field, due_date_field)
-                logger.info("✅ 종료일 설정 완료 (%s): %s", display_name, due_date)
-            else:
-                logger.info("ℹ️ '%s' 프로젝트는 종료일을 설정하지 않습니다.", project_prefix)
+        summary, current_status, resolved_status, _ = await self._do_transition(
+            client=client,
+            key=key,
+            target_status=target_status,
+            issue_data=issue_data,
+            transitions=transitions,
+        )
+
+        # 프로젝트 설정에 따라 종료일 처리
+        project_prefix = _project_prefix(key)
+        due_date_field = self._due_date_field_by_key.get(project_prefix)
+
+        if due_date_field:
+            resp = await client.put(
+                self._issue_url_base + key,
+                json={"fields": {due_date_field: due_date}},
+            )
+            resp.raise_for_status()
+            display_name = self._field_display_names.get(due_date_field, due_date_field)
+            logger.info("✅ 종료일 설정 완료 (%s): %s", display_name, due_date)
+        else:
+            logger.info("ℹ️ '%s' 프로젝트는 종료일을 설정하지 않습니다.", project_prefix)
 
         logger.info("✅ 이슈 완료 처리 성공: %s", key)
         return {
@@ -285,7 +374,7 @@ class JiraAdapter:
             "previous_status": current_status,
             "new_status": resolved_status,
             "due_date": due_date,
-            "url": f"{self.base_url}/browse/{key}",
+            "url": self._browse_base + key,
         }
 
     async def transition_issue(self, key: str, target_status: str) -> dict:
@@ -301,12 +390,11 @@ class JiraAdapter:
         """
         logger.info("🔄 이슈 상태 전환 시작: key=%s, target_status=%s", key, target_status)
 
-        async with self._client() as client:
-            summary, current_status, resolved_status, _ = await self._do_transition(
-                client=client,
-                key=key,
-                target_status=target_status,
-            )
+        summary, current_status, resolved_status, _ = await self._do_transition(
+            client=self._client(),
+            key=key,
+            target_status=target_status,
+        )
 
         logger.info("✅ 이슈 상태 전환 성공: %s", key)
         return {
@@ -314,7 +402,7 @@ class JiraAdapter:
             "summary": summary,
             "previous_status": current_status,
             "new_status": resolved_status,
-            "url": f"{self.base_url}/browse/{key}",
+            "url": self._browse_base + key,
         }
 
     # ------------------------------------------------------------------
@@ -322,11 +410,24 @@ class JiraAdapter:
     # ------------------------------------------------------------------
 
     def _client(self) -> httpx.AsyncClient:
-        """auth와 timeout이 설정된 httpx.AsyncClient를 반환합니다."""
-        return httpx.AsyncClient(
-            auth=(self.user, self.password),
-            timeout=30.0,
-        )
+        """auth와 timeout이 설정된 공유 httpx.AsyncClient를 반환합니다.
+
+        매 요청마다 클라이언트를 만들면 TCP/TLS 연결을 새로 맺으므로 하나를 재사용합니다.
+        닫힌 뒤(aclose) 다시 호출되면 새로 생성합니다.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                auth=(self.user, self.password),
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트를 닫습니다 (서버 종료 시 호출)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _request(
         self,
@@ -340,20 +441,19 @@ class JiraAdapter:
     ) -> dict:
         """공통 HTTP 요청. JSON dict 반환."""
         try:
-            async with self._client() as client:
-                response = await client.request(method, url, **kwargs)
-                logger.info("%s: %d", status_label, response.status_code)
-                response.raise_for_status()
-                return response.json()
+            response = await self._client().request(method, url, **kwargs)
+            logger.info("%s: %d", status_label, response.status_code)
+            response.raise_for_status()
+            return await json_codec.aloads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error("❌ HTTP 오류 발생: %d", e.response.status_code)
             logger.error("응답 본문: %s", e.response.text[:500])
             self._raise_jira_error(e, custom_errors)
         except httpx.NetworkError as e:
-            logger.error("❌ 네트워크 오류: %s", str(e))
+            logger.error("❌ 네트워크 오류: %s", e)
             raise RuntimeError(f"Jira 서버 연결 실패: {self.base_url}") from e
         except Exception as e:
-            logger.error("❌ 예상치 못한 오류: %s", str(e))
+            logger.error("❌ 예상치 못한 오류: %s", e)
             raise RuntimeError(f"{context_msg} 중 오류 발생: {str(e)}") from e
 
     def _raise_jira_error(
@@ -375,59 +475,78 @@ class JiraAdapter:
         else:
             raise RuntimeError(f"Jira API 오류: {status}") from e
 
+    async def _fetch_transition_context(
+        self,
+        client: httpx.AsyncClient,
+        key: str,
+    ) -> tuple[dict, list[dict]]:
+        """이슈 기본 정보와 트랜지션 목록을 동시에 조회합니다.
+
+        Returns:
+            (issue_data, 트랜지션 응답 목록)
+        """
+        issue_resp, trans_resp = await asyncio.gather(
+            client.get(
+                self._issue_url_base + key,
+                params={"fields": "summary,status,issuetype,project"},
+            ),
+            client.get(self._issue_url_base + key + "/transitions"),
+        )
+        issue_resp.raise_for_status()
+        trans_resp.raise_for_status()
+
+        transitions: list[dict] = json_codec.loads(trans_resp.content).get("transitions", [])
+        if logger.isEnabledFor(logging.DEBUG):
+            for t in transitions:
+                logger.debug("  가능한 트랜지션: %s (id=%s)", _transition_target(t), t.get("id", ""))
+
+        return json_codec.loads(issue_resp.content), transitions
+
     async def _do_transition(
         self,
         client: httpx.AsyncClient,
         key: str,
         target_status: str,
+        *,
+        issue_data: dict | None = None,
+        transitions: list[dict] | None = None,
     ) -> tuple[str, str, str, str]:
         """
         공통 트랜지션 실행 헬퍼.
 
-        1. 이슈 기본 정보 조회 (summary, current_status, issuetype)
-        2. 사용 가능한 트랜지션 목록 조회
-        3. target_status 와 일치하는 트랜지션 실행
+        1. 이슈 기본 정보 + 사용 가능한 트랜지션 목록 조회 (호출부가 이미 조회했으면 생략)
+        2. target_status 와 일치하는 트랜지션 실행
 
         Returns:
             (summary, current_status, resolved_target_status, issuetype)
         """
-        # 1. 이슈 조회
-        resp = await client.get(
-            f"{self.base_url}/rest/api/2/issue/{key}",
-            params={"fields": "summary,status,issuetype,project"},
-        )
-        resp.raise_for_status()
-        issue_data = resp.json()
+        # 1. 이슈 조회 + 트랜지션 목록 조회
+        if issue_data is None or transitions is None:
+            issue_data, transitions = await self._fetch_transition_context(client, key)
+
         fields = issue_data.get("fields", {})
         current_status = fields.get("status", {}).get("name", "")
         issuetype = fields.get("issuetype", {}).get("name", "")
         summary = fields.get("summary", "")
         logger.info("이슈 정보: status=%s, issuetype=%s", current_status, issuetype)
 
-        # 2. 트랜지션 목록 조회 → {상태명: 트랜지션 ID}
-        transitions_url = f"{self.base_url}/rest/api/2/issue/{key}/transitions"
-        resp = await client.get(transitions_url)
-        resp.raise_for_status()
-        transitions_map: dict[str, str] = {}
-        for t in resp.json().get("transitions", []):
-            t_name = t.get("to", {}).get("name", "")
-            t_id = t.get("id", "")
-            transitions_map[t_name] = t_id
-            logger.info("  가능한 트랜지션: %s (id=%s)", t_name, t_id)
-
-        # 3. 목표 상태 결정
-        transition_id = transitions_map.get(target_status)
+        # 2. 목표 상태 결정
+        # 목표 상태 하나만 찾으면 되므로 일치하는 트랜지션에서 바로 중단 (전체 목록은 오류 메시지에서만 생성)
+        transition_id = next(
+            (t.get("id", "") for t in transitions if _transition_target(t) == target_status),
+            None,
+        )
         if not transition_id:
-            available = list(transitions_map.keys())
+            available = [_transition_target(t) for t in transitions]
             raise RuntimeError(
                 f"이슈 '{key}'({issuetype})에서 '{target_status}' 상태로 전환할 수 없습니다. "
                 f"사용 가능한 트랜지션: {available}"
             )
         logger.info("선택된 상태: %s (트랜지션 id=%s)", target_status, transition_id)
 
-        # 4. 트랜지션 실행
+        # 3. 트랜지션 실행
         resp = await client.post(
-            transitions_url,
+            self._issue_url_base + key + "/transitions",
             json={"transition": {"id": transition_id}},
         )
         resp.raise_for_status()
@@ -437,39 +556,40 @@ class JiraAdapter:
 
     def _parse_issue(self, issue_data: dict[str, str | dict[str, str]]) -> JiraIssue:
         """API 응답을 JiraIssue 엔티티로 파싱합니다."""
-        fields = issue_data.get("fields", {})
+        fields = issue_data.get("fields")
         if not isinstance(fields, dict):
-            fields = {}
+            fields = _EMPTY
+        get = fields.get
 
-        status_obj = fields.get("status")
+        status_obj = get("status")
         status = status_obj.get("name", "Unknown") if isinstance(status_obj, dict) else "Unknown"
 
-        assignee_obj = fields.get("assignee")
+        assignee_obj = get("assignee")
         assignee = assignee_obj.get("displayName", "Unassigned") if isinstance(assignee_obj, dict) else "Unassigned"
 
-        issuetype_obj = fields.get("issuetype")
+        issuetype_obj = get("issuetype")
         issuetype = issuetype_obj.get("name", "Unknown") if isinstance(issuetype_obj, dict) else "Unknown"
 
-        description_raw = fields.get("description")
+        description_raw = get("description")
         description = str(description_raw) if description_raw is not None else None
 
         # 날짜 필드
-        created_raw = fields.get("created")
+        created_raw = get("created")
         created_str = str(created_raw)[:10] if created_raw else None
 
         # 동적 커스텀 필드 수집
-        custom_fields_data: dict[str, str | None] = {}
-        for cf_id in self._custom_field_ids:
-            raw_val = fields.get(cf_id)
-            custom_fields_data[cf_id] = str(raw_val) if raw_val is not None else None
+        custom_fields_data: dict[str, str | None] = {
+            cf_id: str(raw_val) if (raw_val := get(cf_id)) is not None else None
+            for cf_id in self._custom_field_ids
+        }
 
         # 이슈 URL (브라우저에서 열 수 있는 링크)
         key = str(issue_data.get("key", ""))
-        url = f"{self.base_url}/browse/{key}" if key else ""
+        url = self._browse_base + key if key else ""
 
         return JiraIssue(
             key=key,
-            summary=str(fields.get("summary", "")),
+            summary=str(get("summary", "")),
             status=status,
             assignee=assignee,
             description=description,
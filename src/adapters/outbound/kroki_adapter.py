@@ -21,6 +21,20 @@ class KrokiAdapter:
 
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
+        # 요청 간 연결(keep-alive)을 재사용하는 공유 클라이언트 (첫 요청 시 생성)
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """공유 httpx.AsyncClient를 반환합니다. 닫힌 뒤(aclose) 다시 호출되면 새로 생성합니다."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient()
+        return self._http
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트를 닫습니다 (서버 종료 시 호출)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def render(
         self,
@@ -41,14 +55,13 @@ class KrokiAdapter:
         logger.info("Kroki 렌더링 요청: type=%s, format=%s", diagram_type, output_format)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    content=code.encode("utf-8"),
-                    headers={"Content-Type": "text/plain"},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+            response = await self._client().post(
+                url,
+                content=code.encode("utf-8"),
+                headers={"Content-Type": "text/plain"},
+                timeout=30.0,
+            )
+            response.raise_for_status()
         except httpx.ConnectError as e:
             raise RuntimeError(
                 f"Kroki 서버 연결 실패: {self.base_url}\n"
@@ -98,11 +111,10 @@ class KrokiAdapter:
     async def health_check(self) -> bool:
         """Kroki 서버 헬스 체크."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/health",
-                    timeout=5.0,
-                )
-                return response.status_code == 200
+            response = await self._client().get(
+                f"{self.base_url}/health",
+                timeout=5.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
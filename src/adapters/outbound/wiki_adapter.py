@@ -1,7 +1,11 @@
 import logging
+import time
+from collections import OrderedDict
 
 import httpx
 
+from src.common import json_codec
+from src.common.singleflight import SingleFlight
 from src.domain.wiki import WikiPage, WikiPageWithContent
 
 logger = logging.getLogger(__name__)
@@ -10,13 +14,49 @@ logger = logging.getLogger(__name__)
 class WikiAdapter:
     """Confluence REST API와 통신하는 Outbound Adapter"""
 
+    # 하위 페이지 목록 캐시 유지 시간 (초)
+    _CHILD_TTL = 30.0
+    # 제목 검색 결과(미발견 포함) 캐시 유지 시간 (초)
+    _TITLE_TTL = 30.0
+    # 제목 검색 결과 캐시 최대 항목 수
+    _TITLE_CACHE_MAX_SIZE = 256
+
     def __init__(self, base_url: str, user: str, password: str):
         self.base_url = base_url.rstrip("/")
+        # 페이지 URL 생성용 고정 접두부
+        self._view_page_base = f"{self.base_url}/pages/viewpage.action?pageId="
         self.user = user
         self.password = password
+        # 요청 간 연결(keep-alive)을 재사용하는 공유 클라이언트 (첫 요청 시 생성)
+        self._http: httpx.AsyncClient | None = None
+        # 같은 페이지의 하위 목록 동시 조회를 하나의 API 호출로 합침
+        self._child_flights: SingleFlight[list[WikiPage]] = SingleFlight()
+        # {page_id: (저장 시각(monotonic), 하위 페이지 목록)} - create_page 시 부모 항목 무효화
+        self._child_cache: dict[str, tuple[float, list[WikiPage]]] = {}
+        # {(parent_id, title): (저장 시각(monotonic), 검색 결과)} - 저장 순서 유지, create_page 시 생성된 페이지로 갱신
+        self._title_cache: OrderedDict[tuple[str, str], tuple[float, WikiPage | None]] = OrderedDict()
 
     async def get_child_pages(self, page_id: str, limit: int = 50) -> list[WikiPage]:
-        """특정 페이지의 하위 페이지 목록을 페이지네이션으로 전체 조회합니다."""
+        """특정 페이지의 하위 페이지 목록을 페이지네이션으로 전체 조회합니다. (_CHILD_TTL 동안 캐시)"""
+        cached = self._cached_child_pages(page_id)
+        if cached is not None:
+            logger.info("하위 페이지 캐시 사용: page_id=%s (%d건)", page_id, len(cached))
+            return list(cached)
+
+        pages = await self._child_flights.do(
+            (page_id, limit), lambda: self._get_child_pages(page_id, limit),
+        )
+        self._child_cache[page_id] = (time.monotonic(), pages)
+        return list(pages)
+
+    def _cached_child_pages(self, page_id: str) -> list[WikiPage] | None:
+        """_CHILD_TTL 이내에 조회한 하위 페이지 목록을 반환합니다 (없으면 None)."""
+        cached = self._child_cache.get(page_id)
+        if cached is not None and time.monotonic() - cached[0] < self._CHILD_TTL:
+            return cached[1]
+        return None
+
+    async def _get_child_pages(self, page_id: str, limit: int) -> list[WikiPage]:
         url = f"{self.base_url}/rest/api/content/{page_id}/child/page"
         logger.info("🌐 Confluence 하위 페이지 조회: page_id=%s", page_id)
 
@@ -82,6 +122,10 @@ class WikiAdapter:
             url=self._build_page_url(data),
             space_key=space_key,
         )
+        # 새 페이지가 이후 하위 목록 조회에 바로 보이도록 부모 캐시 무효화
+        self._child_cache.pop(parent_page_id, None)
+        # 제목 캐시는 새 페이지로 갱신 (다른 제목 항목은 유지, 지연되는 CQL 재검색 방지)
+        self._store_title(parent_page_id, page.title, page)
         logger.info("✅ 페이지 생성 완료: id=%s, title=%s", page.id, page.title)
         return page
 
@@ -90,8 +134,82 @@ class WikiAdapter:
         parent_page_id: str,
         title: str,
     ) -> WikiPage | None:
-        """부모 페이지 하위에서 제목으로 페이지를 검색합니다."""
+        """부모 페이지 하위에서 제목으로 페이지를 검색합니다.
+
+        하위 목록이 캐시되어 있으면 그 목록에서 찾고, 없으면 CQL 검색으로 서버에서 필터링합니다.
+        CQL을 지원하지 않는 서버(400/404)나 숫자가 아닌 parent_id는 하위 목록을 순회합니다.
+        결과는 (parent_id, title)별로 _TITLE_TTL 동안 캐시합니다.
+        """
+        key = (parent_page_id, title)
+        cached = self._title_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._TITLE_TTL:
+                logger.info("제목 검색 캐시 사용: title=%s (parent_id=%s)", title, parent_page_id)
+                return cached[1]
+            del self._title_cache[key]
+
+        page = await self._find_page_by_title(parent_page_id, title)
+        self._store_title(parent_page_id, title, page)
+        return page
+
+    def _store_title(self, parent_page_id: str, title: str, page: WikiPage | None) -> None:
+        """제목 검색 결과를 캐시합니다. 만료 항목과 최대 크기를 넘는 오래된 항목은 삭제합니다."""
+        cache = self._title_cache
+        now = time.monotonic()
+        cache.pop((parent_page_id, title), None)
+        # 저장 순서 = 저장 시각 순서이므로 앞쪽부터 만료 항목을 제거
+        while cache and now - next(iter(cache.values()))[0] >= self._TITLE_TTL:
+            cache.popitem(last=False)
+        if len(cache) >= self._TITLE_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+        cache[(parent_page_id, title)] = (now, page)
+
+    async def _find_page_by_title(self, parent_page_id: str, title: str) -> WikiPage | None:
+        cached_children = self._cached_child_pages(parent_page_id)
+        if cached_children is not None:
+            # 하위 목록은 DB 조회 결과라 CQL 색인 지연이 없고 추가 요청도 필요 없음
+            return self._match_title(cached_children, title, parent_page_id)
+        if not parent_page_id.isdigit():
+            # page id는 숫자이므로 그 외 값은 CQL에 넣지 않음
+            return await self._find_child_by_title(parent_page_id, title)
+
+        url = f"{self.base_url}/rest/api/content/search"
+        escaped = title.replace("\\", "\\\\").replace('"', '\\"')
+        params = {
+            "cql": f'parent={parent_page_id} AND title="{escaped}" AND type=page',
+            # CQL title 비교는 대소문자를 구분하지 않을 수 있어 몇 건 받아 정확히 일치하는 것을 고름
+            "limit": 10,
+        }
+        try:
+            data = await self._request("GET", url, params=params, error_text_limit=200)
+        except RuntimeError as e:
+            cause = e.__cause__
+            if isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code in (400, 404):
+                logger.info("CQL 검색 실패 → 하위 페이지 목록에서 검색: parent_id=%s", parent_page_id)
+                return await self._find_child_by_title(parent_page_id, title)
+            raise
+
+        for result in data.get("results", []):
+            if result.get("title") == title:
+                page = WikiPage(
+                    id=str(result.get("id", "")),
+                    title=title,
+                    url=self._build_page_url(result),
+                    space_key=result.get("space", {}).get("key", ""),
+                )
+                logger.info("✅ 페이지 발견: [%s] %s", page.id, page.title)
+                return page
+        logger.info("페이지 없음: title=%s (parent_id=%s)", title, parent_page_id)
+        return None
+
+    async def _find_child_by_title(self, parent_page_id: str, title: str) -> WikiPage | None:
+        """하위 페이지 전체 목록을 조회해 제목이 일치하는 페이지를 찾습니다."""
         child_pages = await self.get_child_pages(parent_page_id)
+        return self._match_title(child_pages, title, parent_page_id)
+
+    @staticmethod
+    def _match_title(child_pages: list[WikiPage], title: str, parent_page_id: str) -> WikiPage | None:
+        """하위 페이지 목록에서 제목이 정확히 일치하는 페이지를 찾습니다."""
         for page in child_pages:
             if page.title == title:
                 logger.info("✅ 페이지 발견: [%s] %s", page.id, page.title)
@@ -276,16 +394,13 @@ class WikiAdapter:
         )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    auth=(self.user, self.password),
-                    headers={"X-Atlassian-Token": "nocheck"},
-                    files={"file": (filename, data, content_type)},
-                    data={"comment": comment} if comment else {},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+            response = await self._client().post(
+                url,
+                headers={"X-Atlassian-Token": "nocheck"},
+                files={"file": (filename, data, content_type)},
+                data={"comment": comment} if comment else {},
+            )
+            response.raise_for_status()
 
             logger.info("✅ 첨부파일 업로드 완료: %s", filename)
             return filename
@@ -311,34 +426,50 @@ class WikiAdapter:
         """기존 첨부파일을 새 버전으로 업데이트한다."""
         base = f"{self.base_url}/rest/api/content/{page_id}/child/attachment"
 
-        async with httpx.AsyncClient() as client:
-            # 기존 첨부파일 ID 조회
-            resp = await client.get(
-                base,
-                params={"filename": filename},
-                auth=(self.user, self.password),
-                timeout=15.0,
-            )
-            resp.raise_for_status()
-            results = resp.json().get("results", [])
-            if not results:
-                raise RuntimeError(f"첨부파일 '{filename}'을 찾을 수 없습니다")
+        client = self._client()
+        # 기존 첨부파일 ID 조회
+        resp = await client.get(
+            base,
+            params={"filename": filename},
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        results = json_codec.loads(resp.content).get("results", [])
+        if not results:
+            raise RuntimeError(f"첨부파일 '{filename}'을 찾을 수 없습니다")
+
+        att_id = results[0]["id"]
+        update_url = f"{base}/{att_id}/data"
+
+        response = await client.post(
+            update_url,
+            headers={"X-Atlassian-Token": "nocheck"},
+            files={"file": (filename, data, content_type)},
+            data={"comment": comment} if comment else {},
+        )
+        response.raise_for_status()
 
-            att_id = results[0]["id"]
-            update_url = f"{base}/{att_id}/data"
+        logger.info("✅ 기존 첨부파일 업데이트 완료: %s (id=%s)", filename, att_id)
+        return filename
+
+    def _client(self) -> httpx.AsyncClient:
+        """auth와 timeout이 설정된 공유 httpx.AsyncClient를 반환합니다.
 
-            response = await client.post(
-                update_url,
+        닫힌 뒤(aclose) 다시 호출되면 새로 생성합니다.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
                 auth=(self.user, self.password),
-                headers={"X-Atlassian-Token": "nocheck"},
-                files={"file": (filename, data, content_type)},
-                data={"comment": comment} if comment else {},
                 timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
             )
-            response.raise_for_status()
+        return self._http
 
-        logger.info("✅ 기존 첨부파일 업데이트 완료: %s (id=%s)", filename, att_id)
-        return filename
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트를 닫습니다 (서버 종료 시 호출)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _request(
         self,
@@ -351,17 +482,10 @@ class WikiAdapter:
     ) -> dict:
         """공통 HTTP 요청을 수행하고 JSON 응답을 반환합니다."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method,
-                    url,
-                    auth=(self.user, self.password),
-                    timeout=30.0,
-                    **kwargs,
-                )
-                logger.info("HTTP Status: %d", response.status_code)
-                response.raise_for_status()
-                return response.json()
+            response = await self._client().request(method, url, **kwargs)
+            logger.info("HTTP Status: %d", response.status_code)
+            response.raise_for_status()
+            return await json_codec.aloads(response.content)
 
         except httpx.HTTPStatusError as e:
             logger.error("❌ HTTP 오류: %d - %s", e.response.status_code, e.response.text[:error_text_limit])
@@ -369,7 +493,7 @@ class WikiAdapter:
                 raise RuntimeError(custom_errors[e.response.status_code]) from e
             self._raise_http_error(e)
         except httpx.NetworkError as e:
-            logger.error("❌ 네트워크 오류: %s", str(e))
+            logger.error("❌ 네트워크 오류: %s", e)
             raise RuntimeError(f"Confluence 서버 연결 실패: {self.base_url}") from e
 
     def _build_page_url(self, data: dict) -> str:
@@ -377,9 +501,9 @@ class WikiAdapter:
         links = data.get("_links", {})
         webui = links.get("webui", "")
         if webui:
-            return f"{self.base_url}{webui}"
+            return self.base_url + webui
         page_id = data.get("id", "")
-        return f"{self.base_url}/pages/viewpage.action?pageId={page_id}" if page_id else ""
+        return f"{self._view_page_base}{page_id}" if page_id else ""
 
     def _raise_http_error(self, e: httpx.HTTPStatusError) -> None:
         """HTTP 상태 코드별 적절한 RuntimeError를 발생시킵니다."""
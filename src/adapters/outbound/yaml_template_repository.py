@@ -1,23 +1,44 @@
+import hashlib
 import logging
+import time
 from pathlib import Path
 
 import yaml
 
 from src.domain.wiki_workflow import WikiTemplate, WikiTitleFormat
 
+try:
+    # libyaml 바인딩이 있으면 C 구현 로더 사용
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
 class YamlTemplateRepository:
     """YAML 파일 기반 Wiki 템플릿 저장소 (mtime 캐시)"""
 
+    # mtime 재확인 간격 (초) - 이 시간 안의 반복 호출은 stat 없이 캐시 반환
+    _STAT_TTL = 5.0
+
     def __init__(self, yaml_path: str | Path):
         self._path = Path(yaml_path)
         self._cache: dict | None = None
         self._cache_mtime: float = 0.0
+        # 로드한 파일 내용의 해시 (mtime만 바뀌고 내용이 같으면 재파싱 생략)
+        self._cache_hash: bytes = b""
+        self._last_stat_check: float = 0.0
+        # 현재 로드된 YAML 기준으로 생성한 불변 객체 캐시 (재로드 시 비움)
+        self._title_formats: WikiTitleFormat | None = None
+        self._templates: dict[str, WikiTemplate] = {}
 
     def _ensure_loaded(self) -> dict:
-        """파일이 변경되었으면 다시 로드합니다."""
+        """파일이 변경되었으면 다시 로드합니다. (mtime 확인은 _STAT_TTL 간격으로만 수행)"""
+        now = time.monotonic()
+        if self._cache is not None and now - self._last_stat_check < self._STAT_TTL:
+            return self._cache
+
         try:
             current_mtime = self._path.stat().st_mtime
         except FileNotFoundError:
@@ -25,28 +46,43 @@ class YamlTemplateRepository:
                 f"템플릿 YAML 파일을 찾을 수 없습니다: {self._path}"
             )
 
-        if self._cache is None or current_mtime > self._cache_mtime:
-            logger.info("YAML 템플릿 로드: %s", self._path)
-            with open(self._path, "r", encoding="utf-8") as f:
-                self._cache = yaml.safe_load(f)
+        if self._cache is None or current_mtime != self._cache_mtime:
+            raw = self._path.read_bytes()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if self._cache is not None and digest == self._cache_hash:
+                logger.debug("YAML 템플릿 mtime만 변경됨 (내용 동일): %s", self._path)
+            else:
+                logger.info("YAML 템플릿 로드: %s", self._path)
+                # bytes를 그대로 넘겨 로더가 한 번에 디코딩하도록 함 (UTF-8/BOM 자동 감지)
+                self._cache = yaml.load(raw, Loader=_SafeLoader)
+                self._cache_hash = digest
+                self._title_formats = None
+                self._templates = {}
+                logger.info(
+                    "YAML 템플릿 로드 완료: %d 워크플로우",
+                    len(self._cache.get("workflows", {})),
+                )
             self._cache_mtime = current_mtime
-            logger.info(
-                "YAML 템플릿 로드 완료: %d 워크플로우",
-                len(self._cache.get("workflows", {})),
-            )
 
+        self._last_stat_check = now
         return self._cache
 
     def get_title_formats(self) -> WikiTitleFormat:
         data = self._ensure_loaded()
-        formats = data.get("title_formats", {})
-        return WikiTitleFormat(
-            year_format=formats.get("year", "{{ YEAR }}년"),
-            month_format=formats.get("month", "{{ MONTH }}월"),
-        )
+        if self._title_formats is None:
+            formats = data.get("title_formats", {})
+            self._title_formats = WikiTitleFormat(
+                year_format=formats.get("year", "{{ YEAR }}년"),
+                month_format=formats.get("month", "{{ MONTH }}월"),
+            )
+        return self._title_formats
 
     def get_workflow_template(self, workflow_type: str) -> WikiTemplate:
         data = self._ensure_loaded()
+        cached = self._templates.get(workflow_type)
+        if cached is not None:
+            return cached
+
         workflows = data.get("workflows", {})
         if workflow_type not in workflows:
             available = list(workflows.keys())
@@ -54,14 +90,19 @@ class YamlTemplateRepository:
                 f"존재하지 않는 워크플로우: '{workflow_type}'. 사용 가능: {available}"
             )
         wf = workflows[workflow_type]
-        return WikiTemplate(
+        template = self._templates[workflow_type] = WikiTemplate(
             workflow_type=workflow_type,
             body=wf.get("body", ""),
             description=wf.get("description", ""),
         )
+        return template
 
     def reload(self) -> None:
         """캐시를 강제로 무효화합니다."""
         logger.info("템플릿 캐시 강제 무효화")
         self._cache = None
         self._cache_mtime = 0.0
+        self._cache_hash = b""
+        self._last_stat_check = 0.0
+        self._title_formats = None
+        self._templates = {}
@@ -15,8 +15,11 @@ class DiffResult:
 class DiffCollectionPort(Protocol):
     """코드 diff 수집 계약"""
 
-    async def collect_by_branch(self, branch_name: str) -> DiffResult:
-        """브랜치명 기반으로 커밋 목록과 diff를 수집합니다."""
+    async def collect_by_branch(self, branch_name: str, *, include_diff: bool = True) -> DiffResult:
+        """브랜치명 기반으로 커밋 목록과 diff를 수집합니다.
+
+        include_diff=False이면 diff 본문은 생략합니다 (diff_raw는 빈 문자열).
+        """
         ...
 
     async def collect_by_commit_range(self, from_ref: str, to_ref: str) -> DiffResult:
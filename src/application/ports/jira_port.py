@@ -6,8 +6,13 @@ from src.domain.jira import JiraIssue, JiraFilter, JiraProjectMeta
 class JiraPort(Protocol):
     """Jira 서비스와의 계약을 정의하는 Port"""
 
-    async def search_issues(self, jql: str) -> list[JiraIssue]:
-        """JQL 쿼리를 사용하여 Jira 이슈를 조회합니다."""
+    async def search_issues(
+        self, jql: str, *, batch_size: int = 500, max_total: int | None = None,
+    ) -> list[JiraIssue]:
+        """JQL 쿼리를 사용하여 Jira 이슈를 조회합니다.
+
+        batch_size건씩 페이지를 나눠 전체(또는 max_total건까지)를 조회합니다.
+        """
         ...
 
     async def create_filter(self, name: str, jql: str) -> JiraFilter:
@@ -1,13 +1,23 @@
 import logging
 
 import mistune
-from jinja2 import BaseLoader, Environment, Undefined
+from jinja2 import BaseLoader, Environment, Template, Undefined
 from markupsafe import Markup
+from mistune.util import escape as escape_html
 
 from src.application.ports.template_repository_port import TemplateRepositoryPort
+from src.domain.wiki_workflow import WikiTitleFormat
 
 logger = logging.getLogger(__name__)
 
+# 생성/리로드 시 미리 컴파일해 둘 워크플로우 템플릿
+_PREWARM_WORKFLOWS = ("workflow_a", "workflow_b", "workflow_c")
+
+# 이 문자가 하나도 없는 한 줄 요약은 마크다운 파서를 거치지 않고 <p>로 감쌈
+_MARKDOWN_SPECIAL_CHARS = frozenset("*_`#[]<>!\\|~&\r\n")
+# 줄 첫 글자가 목록 마커(-, +, 숫자.)일 수 있는 경우도 파서로 보냄
+_LIST_MARKER_START = frozenset("-+0123456789")
+
 
 class LoggingUndefined(Undefined):
     """미치환 변수 접근 시 경고 로그를 출력합니다."""
@@ -24,6 +34,10 @@ class _ConfluenceRenderer(mistune.HTMLRenderer):
     """
     _MIN_HEADING = 3
     _MAX_HEADING = 6
+    # code 매크로의 고정 부분 (language, 코드 본문 앞뒤로 분할)
+    _MACRO_PRE = '<ac:structured-macro ac:name="code">\n  <ac:parameter ac:name="language">'
+    _MACRO_MID = '</ac:parameter>\n  <ac:plain-text-body><![CDATA['
+    _MACRO_SUF = ']]></ac:plain-text-body>\n</ac:structured-macro>\n'
 
     def heading(self, text: str, level: int, **attrs) -> str:
         target = min(max(level + 1, self._MIN_HEADING), self._MAX_HEADING)
@@ -31,13 +45,10 @@ class _ConfluenceRenderer(mistune.HTMLRenderer):
 
     def block_code(self, code: str, info=None, **attrs) -> str:
         language = info.strip() if info else "text"
-        safe_code = code.replace("]]>", "]]]]><![CDATA[>")
-        return (
-            f'<ac:structured-macro ac:name="code">\n'
-            f'  <ac:parameter ac:name="language">{language}</ac:parameter>\n'
-            f'  <ac:plain-text-body><![CDATA[{safe_code}]]></ac:plain-text-body>\n'
-            f'</ac:structured-macro>\n'
-        )
+        # CDATA 종료 시퀀스가 있을 때만 분할 치환
+        if "]]>" in code:
+            code = code.replace("]]>", "]]]]><![CDATA[>")
+        return "".join((self._MACRO_PRE, language, self._MACRO_MID, code, self._MACRO_SUF))
 
 
 class TemplateRenderer:
@@ -56,26 +67,65 @@ class TemplateRenderer:
             renderer=_ConfluenceRenderer(escape=True),
             plugins=['table', 'strikethrough'],
         )
+        # 템플릿 원문 → 컴파일된 Template 캐시 (원문이 같으면 재컴파일 생략)
+        self._compiled: dict[str, Template] = {}
+        # (제목 형식, 년, 월) → (년도 제목, 월 제목) 캐시 (형식이 바뀌면 키가 달라짐)
+        self._title_cache: dict[tuple[WikiTitleFormat, int, int], tuple[str, str]] = {}
+        self.prewarm()
+
+    def _compile(self, source: str) -> Template:
+        """템플릿 원문을 컴파일합니다. 같은 원문은 캐시된 Template을 재사용합니다."""
+        template = self._compiled.get(source)
+        if template is None:
+            template = self._compiled[source] = self._env.from_string(source)
+        return template
+
+    def prewarm(self) -> None:
+        """워크플로우 본문과 년/월 제목 형식을 미리 컴파일해 첫 렌더링의 컴파일 비용을 없앱니다.
+
+        템플릿 로드에 실패해도 예외를 올리지 않고, 실제 렌더링 시점에 다시 시도합니다.
+        """
+        try:
+            title_formats = self._repo.get_title_formats()
+            sources = [title_formats.year_format, title_formats.month_format]
+            sources += [self._repo.get_workflow_template(wf).body for wf in _PREWARM_WORKFLOWS]
+            for source in sources:
+                self._compile(source)
+        except Exception as e:
+            logger.warning("템플릿 사전 컴파일 실패 (렌더링 시 다시 시도): %s", e)
+            return
+        logger.info("템플릿 사전 컴파일 완료: %d개", len(self._compiled))
+
+    def reload(self) -> None:
+        """컴파일된 템플릿 캐시를 비우고 다시 사전 컴파일합니다 (템플릿 리로드 시 호출)."""
+        self._compiled.clear()
+        self._title_cache.clear()
+        self.prewarm()
 
     def render_workflow_body(self, workflow_type: str, variables: dict[str, str]) -> str:
         """워크플로우 템플릿을 렌더링합니다."""
         wiki_template = self._repo.get_workflow_template(workflow_type)
-        template = self._env.from_string(wiki_template.body)
+        template = self._compile(wiki_template.body)
         rendered = template.render(**variables)
         logger.info("템플릿 렌더링 완료: workflow=%s, 길이=%d", workflow_type, len(rendered))
         return rendered
 
     def render_title(self, format_str: str, variables: dict[str, str]) -> str:
         """제목 형식 문자열을 렌더링합니다."""
-        template = self._env.from_string(format_str)
-        return template.render(**variables)
+        return self._compile(format_str).render(**variables)
 
     def build_year_month_titles(self, year: int, month: int) -> tuple[str, str]:
-        """년도/월 페이지 제목을 생성합니다."""
+        """년도/월 페이지 제목을 생성합니다. (같은 형식·년·월은 캐시된 결과 반환)"""
         title_formats = self._repo.get_title_formats()
+        cache_key = (title_formats, year, month)
+        cached = self._title_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         vars_ = {"YEAR": str(year), "MONTH": str(month), "MONTH_PADDED": f"{month:02d}", "AUTHOR_NAME": self._author_name}
         year_title = self.render_title(title_formats.year_format, vars_)
         month_title = self.render_title(title_formats.month_format, vars_)
+        self._title_cache[cache_key] = (year_title, month_title)
         return year_title, month_title
 
     def render_change_summary_html(self, summary: str) -> str:
@@ -91,8 +141,13 @@ class TemplateRenderer:
         stripped = summary.strip()
 
         # 이미 HTML 태그로 시작하는 콘텐츠는 그대로 반환 (Markup으로 마킹)
-        if stripped.startswith("<") and not stripped.startswith("< "):
+        if stripped[0] == "<" and stripped[1:2] != " ":
             return Markup(stripped)
 
+        # 마크다운 문법이 없는 한 줄 요약은 파서를 건너뛰고 이스케이프만 적용
+        # (파서 출력과 같도록 mistune의 escape 사용: " → &quot;, ' 는 그대로)
+        if stripped[0] not in _LIST_MARKER_START and _MARKDOWN_SPECIAL_CHARS.isdisjoint(stripped):
+            return Markup(f"<p>{escape_html(stripped)}</p>")
+
         # 마크다운 → Confluence HTML 변환 (결과는 안전한 HTML)
         return Markup(self._md(stripped).strip())
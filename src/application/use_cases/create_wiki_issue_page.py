@@ -4,7 +4,11 @@ from datetime import datetime
 from src.application.ports.diff_collection_port import DiffCollectionPort
 from src.application.services.template_renderer import TemplateRenderer
 from src.adapters.outbound.wiki_adapter import WikiAdapter
-from src.application.use_cases.wiki_generation_orchestrator import _auto_summarize, _build_commit_list_html
+from src.application.use_cases.wiki_generation_orchestrator import (
+    _auto_summarize,
+    _build_commit_list_html,
+    _parse_iso_date,
+)
 from src.domain.wiki import WikiPageCreationResult
 
 logger = logging.getLogger(__name__)
@@ -45,7 +49,7 @@ class CreateWikiIssuePageUseCase:
         # 기준 날짜 결정
         if resolution_date:
             try:
-                base_date = datetime.strptime(resolution_date[:10], "%Y-%m-%d")
+                base_date = _parse_iso_date(resolution_date[:10])
             except ValueError:
                 logger.warning("resolution_date 파싱 실패, 오늘 날짜 사용: %s", resolution_date)
                 base_date = datetime.now()
@@ -133,11 +137,14 @@ class CreateWikiIssuePageUseCase:
     async def _get_git_info(self, branch_name: str, existing_summary: str) -> tuple[str, str]:
         """DiffCollectionPort를 사용하여 git 정보를 수집합니다."""
         try:
-            diff_result = await self._diff_collector.collect_by_branch(branch_name)
+            # 커밋 목록만 사용하므로 diff 본문은 수집하지 않음
+            diff_result = await self._diff_collector.collect_by_branch(branch_name, include_diff=False)
             commit_list_html = _build_commit_list_html(diff_result.commits_raw)
             change_summary = existing_summary.strip() if existing_summary.strip() else _auto_summarize(diff_result.commits_raw)
-            logger.info("Git 커밋 조회 완료: %d lines (branch=%s)", len(diff_result.commits_raw.splitlines()), branch_name)
+            commits_raw = diff_result.commits_raw
+            line_count = commits_raw.count("\n") + 1 if commits_raw else 0
+            logger.info("Git 커밋 조회 완료: %d lines (branch=%s)", line_count, branch_name)
             return commit_list_html, change_summary
         except RuntimeError as e:
-            logger.warning("Git 정보 조회 실패: %s - %s", branch_name, str(e))
+            logger.warning("Git 정보 조회 실패: %s - %s", branch_name, e)
             return "<li>(브랜치를 찾을 수 없음)</li>", existing_summary or "(Git 정보 없음)"
@@ -3,7 +3,11 @@ from datetime import datetime
 
 from src.application.services.template_renderer import TemplateRenderer
 from src.adapters.outbound.wiki_adapter import WikiAdapter
-from src.application.use_cases.wiki_generation_orchestrator import _auto_summarize, _build_commit_list_html
+from src.application.use_cases.wiki_generation_orchestrator import (
+    _auto_summarize,
+    _build_commit_list_html,
+    _parse_iso_date,
+)
 from src.domain.wiki import WikiPageCreationResult
 
 logger = logging.getLogger(__name__)
@@ -56,7 +60,7 @@ class CreateWikiPageWithContentUseCase:
         # 기준 날짜 결정
         if base_date:
             try:
-                parsed_date = datetime.strptime(base_date, "%Y-%m-%d")
+                parsed_date = _parse_iso_date(base_date)
             except ValueError:
                 logger.warning("날짜 형식 오류, 오늘 날짜 사용: %s", base_date)
                 parsed_date = datetime.now()
@@ -48,7 +48,8 @@ class GetJiraIssueByKeyUseCase:
         jql = f'key="{key}"'
         logger.info("생성된 JQL 쿼리: %s", jql)
 
-        issues = await self.jira_port.search_issues(jql)
+        # key는 유일하므로 한 건만 요청 (기본 페이지 크기만큼 받지 않도록)
+        issues = await self.jira_port.search_issues(jql, max_total=1)
 
         if not issues:
             logger.info("이슈를 찾을 수 없음: %s", key)
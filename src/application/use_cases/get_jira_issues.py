@@ -1,8 +1,9 @@
 import logging
 from datetime import date, timedelta
+from typing import Iterator
 
 from src.application.ports.jira_port import JiraPort
-from src.domain.jira import JiraProjectConfig
+from src.domain.jira import JiraIssue, JiraProjectConfig
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,12 @@ class GetJiraIssuesUseCase:
             self._allowed_project_keys = [config.key for config in project_configs]
             for config in project_configs:
                 self._valid_custom_field_names.update(config.jira_custom_fields.keys())
+        # 호출마다 같은 값인 기본 JQL 조건은 생성 시 한 번만 만듦
+        self._default_assignee_condition = f'assignee="{jira_user}"'
+        self._allowed_projects_condition = (
+            "project in (" + ", ".join(f'"{k}"' for k in self._allowed_project_keys) + ")"
+            if self._allowed_project_keys else ""
+        )
 
     async def execute(
         self,
@@ -38,11 +45,37 @@ class GetJiraIssuesUseCase:
         assignee: str | None = None,
         custom_field_filters: dict[str, dict[str, str]] | None = None,
     ) -> list[dict]:
+        """Jira 이슈를 조회해 dict 리스트로 반환합니다. (인자는 stream()과 동일)"""
+        return list(await self.stream(
+            statuses=statuses,
+            project_key=project_key,
+            issuetype=issuetype,
+            created_after=created_after,
+            created_before=created_before,
+            text=text,
+            assignee=assignee,
+            custom_field_filters=custom_field_filters,
+        ))
+
+    async def stream(
+        self,
+        statuses: list[str] | None = None,
+        project_key: str | None = None,
+        issuetype: str | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+        text: str | None = None,
+        assignee: str | None = None,
+        custom_field_filters: dict[str, dict[str, str]] | None = None,
+    ) -> Iterator[dict]:
         """
         Jira 이슈를 조회합니다.
 
+        이슈별 dict는 순회 시점에 하나씩 만들어지므로, 바로 소비하는 호출부는
+        전체 dict 목록을 메모리에 동시에 두지 않습니다.
+
         Args:
-            statuses: 조회할 이슈 상태 목록. None이면 모든 상태 조회 (status 필터 없음)
+            statuses: 조회할 이슈 상태 목록. None 또는 빈 목록이면 모든 상태 조회 (status 필터 없음)
             project_key: 특정 프로젝트로 필터링. None이면 전체 프로젝트 조회
             issuetype: 이슈 유형 필터 (예: "버그", "스토리"). None이면 필터 없음
             created_after: 생성일 시작 범위 (예: "2024-01-01"). None이면 필터 없음
@@ -54,7 +87,7 @@ class GetJiraIssuesUseCase:
                 표시명은 JiraProjectConfig.jira_custom_fields의 키여야 함
 
         Returns:
-            이슈 목록 (dict 형식)
+            이슈 dict 이터레이터
 
         Raises:
             ValueError: custom_field_filters에 알 수 없는 표시명이 포함된 경우
@@ -69,17 +102,17 @@ class GetJiraIssuesUseCase:
             conditions.append(f'assignee="{assignee}"')
             logger.info("담당자 필터: %s", assignee)
         else:
-            conditions.append(f'assignee="{self.jira_user}"')
+            conditions.append(self._default_assignee_condition)
 
         if project_key:
             conditions.append(f'project="{project_key}"')
             logger.info("프로젝트 필터: %s", project_key)
         elif self._allowed_project_keys:
-            keys_filter = ", ".join(f'"{k}"' for k in self._allowed_project_keys)
-            conditions.append(f"project in ({keys_filter})")
+            conditions.append(self._allowed_projects_condition)
             logger.info("설정된 프로젝트로 제한: %s", self._allowed_project_keys)
 
-        if statuses is None:
+        # 빈 목록도 필터 없음으로 처리 (status in () 는 Jira가 거부하는 JQL)
+        if not statuses:
             logger.info("모든 상태의 이슈 조회 (status 필터 없음)")
         else:
             logger.info("사용자 지정 상태 필터: %s", statuses)
@@ -125,18 +158,20 @@ class GetJiraIssuesUseCase:
 
         issues = await self.jira_port.search_issues(jql)
 
-        logger.info("Use Case 실행 완료: %d개 이슈 변환", len(issues))
-
-        return [
-            {
-                "key": issue.key,
-                "summary": issue.summary,
-                "status": issue.status,
-                "assignee": issue.assignee,
-                "description": issue.description,
-                "issuetype": issue.issuetype,
-                "url": issue.url,
-                "custom_fields": dict(issue.custom_fields),
-            }
-            for issue in issues
-        ]
+        logger.info("Use Case 실행 완료: %d개 이슈 조회", len(issues))
+
+        return map(_issue_to_dict, issues)
+
+
+def _issue_to_dict(issue: JiraIssue) -> dict:
+    """JiraIssue를 응답용 dict로 변환합니다."""
+    return {
+        "key": issue.key,
+        "summary": issue.summary,
+        "status": issue.status,
+        "assignee": issue.assignee,
+        "description": issue.description,
+        "issuetype": issue.issuetype,
+        "url": issue.url,
+        "custom_fields": dict(issue.custom_fields),
+    }
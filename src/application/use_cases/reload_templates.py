@@ -1,6 +1,7 @@
 import logging
 
 from src.application.ports.template_repository_port import TemplateRepositoryPort
+from src.application.services.template_renderer import TemplateRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -8,12 +9,15 @@ logger = logging.getLogger(__name__)
 class ReloadTemplatesUseCase:
     """Wiki 템플릿 캐시를 무효화하고 다시 로드하는 Use Case"""
 
-    def __init__(self, template_repo: TemplateRepositoryPort):
+    def __init__(self, template_repo: TemplateRepositoryPort, template_renderer: TemplateRenderer | None = None):
         self._repo = template_repo
+        self._renderer = template_renderer
 
     def execute(self) -> dict:
         logger.info("템플릿 리로드 실행")
         self._repo.reload()
+        if self._renderer is not None:
+            self._renderer.reload()
 
         # 검증: 로드 가능한지 확인
         title_fmts = self._repo.get_title_formats()
@@ -1,7 +1,10 @@
 import html
 import logging
+import re
 import uuid
 from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterator
 
 from markupsafe import Markup
 
@@ -557,7 +560,7 @@ class WikiGenerationOrchestrator:
             date_str = session.base_date
             page_title = session.page_title
 
-        date_obj = datetime.strptime(date_str[:10], "%Y-%m-%d")
+        date_obj = _parse_iso_date(date_str[:10])
         year, month = date_obj.year, date_obj.month
 
         year_title, month_title = self._renderer.build_year_month_titles(year, month)
@@ -738,14 +741,43 @@ class WikiGenerationOrchestrator:
 
 # ── 유틸리티 함수 (기존 create_wiki_page_with_content.py에서 이동) ──
 
+# 커밋 목록 한 줄 (공백만 있는 줄은 _iter_commit_lines에서 제외)
+_COMMIT_LINE_RE = re.compile(r"[^\r\n]+")
+
+
+def _iter_commit_lines(commit_list: str) -> Iterator[str]:
+    """커밋 목록에서 비어 있지 않은 줄을 strip하여 순서대로 반환합니다.
+
+    앞쪽 몇 줄만 쓰는 호출부가 전체 줄 목록을 만들지 않도록 지연 평가합니다.
+    """
+    for match in _COMMIT_LINE_RE.finditer(commit_list):
+        line = match.group().strip()
+        if line:
+            yield line
+
+
+def _parse_iso_date(date_str: str) -> datetime:
+    """YYYY-MM-DD 문자열을 datetime으로 변환합니다. 형식이 다르면 ValueError.
+
+    정확히 10자리 숫자 날짜는 슬라이싱으로 바로 변환하고, 그 외 입력만 strptime으로 처리합니다.
+    """
+    if (
+        len(date_str) == 10 and date_str.isascii() and date_str[4] == "-" and date_str[7] == "-"
+        and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+    ):
+        return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def _build_commit_list_html(commit_list: str) -> str:
     """줄바꿈으로 구분된 커밋 목록을 HTML <li> 형식으로 변환합니다."""
-    if not commit_list or not commit_list.strip():
+    if not commit_list:
         return "<li>(커밋 없음)</li>"
-    lines = [line.strip() for line in commit_list.strip().splitlines() if line.strip()]
-    if not lines:
+    items = [html.escape(line) for line in islice(_iter_commit_lines(commit_list), 100)]
+    if not items:
         return "<li>(커밋 없음)</li>"
-    return "\n".join(f"<li>{html.escape(line)}</li>" for line in lines[:100])
+    # 줄마다 <li> 문자열을 따로 만들지 않고 구분자 join 한 번으로 감쌈
+    return "<li>" + "</li>\n<li>".join(items) + "</li>"
 
 
 def _build_append_section(project_name: str, date_str: str, body_html: str) -> str:
@@ -766,13 +798,13 @@ def _build_append_section(project_name: str, date_str: str, body_html: str) -> s
 
 def _auto_summarize(commit_list: str) -> str:
     """커밋 목록에서 변경 내용 요약을 자동 생성합니다."""
-    if not commit_list or not commit_list.strip():
+    if not commit_list:
         return "(변경 내용 없음)"
-    lines = [line.strip() for line in commit_list.strip().splitlines() if line.strip()]
+    lines = list(islice(_iter_commit_lines(commit_list), 5))
     if not lines:
         return "(변경 내용 없음)"
     summary_lines = []
-    for line in lines[:5]:
+    for line in lines:
         parts = line.split(" ", 1)
         msg = parts[1] if len(parts) == 2 and len(parts[0]) >= 7 else line
         summary_lines.append(f"- {msg}")
@@ -0,0 +1,19 @@
+import asyncio
+
+try:
+    # orjson이 설치되어 있으면 C 구현 디코더 사용 (대용량 검색 응답에서 2~3배 빠름)
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads", "aloads"]
+
+# 이 크기 이상의 응답은 스레드에서 디코딩 (작은 응답은 스레드 전환 비용이 더 큼)
+_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+async def aloads(content: bytes):
+    """큰 JSON은 스레드 풀에서 디코딩해 이벤트 루프가 다른 요청을 계속 처리하도록 합니다."""
+    if len(content) < _OFFLOAD_THRESHOLD:
+        return loads(content)
+    return await asyncio.to_thread(loads, content)
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """같은 키로 동시에 들어온 호출을 하나의 Task로 합치는 헬퍼
+
+    먼저 들어온 호출이 Task를 만들고, 완료 전에 들어온 같은 키의 호출은 그 Task 결과를 함께 기다립니다.
+    완료되면 키가 제거되므로 결과를 캐시하지는 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # 한 호출자가 취소되어도 같은 Task를 기다리는 다른 호출자에게 영향이 없도록 shield
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
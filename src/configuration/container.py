@@ -37,6 +37,9 @@ class Container:
     reload_templates_use_case: ReloadTemplatesUseCase
     template_renderer: TemplateRenderer
     diff_collector: GitLocalAdapter
+    # 작업 디렉토리별 GitLocalAdapter 레지스트리 (MCP 도구가 채우고 close_container가 닫음)
+    git_adapters: dict[str, GitLocalAdapter]
+    jira_adapter: JiraAdapter
     wiki_adapter: WikiAdapter
     kroki_adapter: KrokiAdapter | None
     generate_diagram_use_case: GenerateDiagramUseCase | None
@@ -133,6 +136,7 @@ def build_container() -> Container:
     # 템플릿 핫 리로드
     reload_templates_use_case = ReloadTemplatesUseCase(
         template_repo=template_repo,
+        template_renderer=template_renderer,
     )
 
     return Container(
@@ -149,6 +153,8 @@ def build_container() -> Container:
         reload_templates_use_case=reload_templates_use_case,
         template_renderer=template_renderer,
         diff_collector=diff_collector,
+        git_adapters={},
+        jira_adapter=jira_adapter,
         wiki_adapter=wiki_adapter,
         kroki_adapter=kroki_adapter,
         generate_diagram_use_case=generate_diagram_use_case,
@@ -156,4 +162,17 @@ def build_container() -> Container:
 
 
 def clear_container() -> None:
+    """컨테이너 싱글톤 캐시를 비웁니다. 다음 build_container() 호출 시 설정을 다시 읽어 생성합니다."""
     build_container.cache_clear()
+
+
+async def close_container(container: Container) -> None:
+    """컨테이너 어댑터가 보유한 공유 HTTP 연결과 git 워커 프로세스를 닫습니다 (서버 종료 시 호출)."""
+    await container.jira_adapter.aclose()
+    await container.wiki_adapter.aclose()
+    if container.kroki_adapter is not None:
+        await container.kroki_adapter.aclose()
+    await container.diff_collector.aclose()
+    while container.git_adapters:
+        _, adapter = container.git_adapters.popitem()
+        await adapter.aclose()
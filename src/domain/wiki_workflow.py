@@ -1,8 +1,10 @@
 import re
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 
 from src.domain.jira import JiraProjectConfig
 
@@ -12,6 +14,12 @@ APPROVAL_TOKEN_TTL_MINUTES = 30
 
 def build_issue_key_pattern(project_keys: list[str]) -> re.Pattern[str]:
     """프로젝트 키 리스트로부터 이슈키 추출 정규식을 동적 생성합니다."""
+    return _compile_issue_key_pattern(tuple(project_keys))
+
+
+@lru_cache(maxsize=32)
+def _compile_issue_key_pattern(project_keys: tuple[str, ...]) -> re.Pattern[str]:
+    """프로젝트 키 조합별로 컴파일된 정규식을 캐시합니다 (설정은 프로세스 수명 동안 고정)."""
     if not project_keys:
         # 프로젝트 키가 없으면 매칭 불가 패턴 반환
         return re.compile(r"(?!)")
@@ -24,8 +32,7 @@ def extract_jira_issue_keys(text: str, project_keys: list[str]) -> list[str]:
     if not text or not project_keys:
         return []
     pattern = build_issue_key_pattern(project_keys)
-    keys = [m.group() for m in pattern.finditer(text)]
-    return list(dict.fromkeys(keys))
+    return list(dict.fromkeys(m.group() for m in pattern.finditer(text)))
 
 
 def get_wiki_date_for_issue(
@@ -34,8 +41,8 @@ def get_wiki_date_for_issue(
 ) -> str:
     """프로젝트별 Wiki 경로 날짜를 설정 기반으로 결정합니다."""
     key = str(issue_data.get("key", ""))
-    project_prefix = key.split("-")[0] if "-" in key else ""
-    config = configs_by_key.get(project_prefix)
+    project_prefix, sep, _ = key.partition("-")
+    config = configs_by_key.get(project_prefix) if sep else None
     if not config or not config.wiki_date_field:
         return ""
 
@@ -81,6 +88,8 @@ class WikiSession:
     state: WorkflowState = WorkflowState.INIT
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # TTL 비교용 단조 시계 값 (datetime 연산 없이 float 비교)
+    updated_at_monotonic: float = field(default_factory=time.monotonic, repr=False, compare=False)
 
     # Workflow A specific
     issue_key: str = ""
@@ -133,6 +142,7 @@ class WikiSession:
 
     def touch(self) -> None:
         self.updated_at = datetime.now()
+        self.updated_at_monotonic = time.monotonic()
 
     def is_approval_expired(self) -> bool:
         """승인 토큰이 만료되었는지 확인합니다."""
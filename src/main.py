@@ -9,7 +9,7 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 from src.adapters.inbound.mcp.tools import register_tools
-from src.configuration.container import build_container, clear_container
+from src.configuration.container import build_container, clear_container, close_container
 
 
 def setup_logging():
@@ -115,6 +115,7 @@ async def main() -> None:
             if kroki_started:
                 _stop_kroki(container.settings.kroki_container_name)
                 logger.info("Kroki 컨테이너 정지: %s", container.settings.kroki_container_name)
+            await close_container(container)
             if container.settings.app_env == "local":
                 clear_container()
             logger.info("MCP 서버 종료")
@@ -123,7 +124,7 @@ async def main() -> None:
         logger.error("=" * 60)
         logger.error("MCP 서버 시작 실패!")
         logger.error("오류 타입: %s", type(e).__name__)
-        logger.error("오류 메시지: %s", str(e))
+        logger.error("오류 메시지: %s", e)
         logger.error("=" * 60)
         traceback.print_exc(file=sys.stderr)
         raise